@@ -3,7 +3,6 @@ from operator import itemgetter
 import os
 import subprocess
 
-import dataikuapi
 import pytest
 
 from dku_plugin_test_utils.logger import Log
@@ -11,16 +10,20 @@ from dku_plugin_test_utils.run_config import ScenarioConfiguration
 from dku_plugin_test_utils.run_config import PluginInfo
 
 
-# Entry point for integration test cession, load the logger configuration
-Log()
-
 logger = logging.getLogger("dss-plugin-test.pytest_plugin")
 
+# Parameter used instead of the DSS targets when there is no run configuration to read
+NO_RUN_CONFIG_TARGET = "no-run-config"
+
 
 def pytest_addoption(parser):
     parser.addoption(
         "--exclude-dss-targets", action="store", help="\"Target,[other targets]\". Exclude DSS target from the instance configuration file."
     )
+    parser.addoption(
+        "--skip-dss-targets-without-config", action="store_true", default=False,
+        help="Skip the tests targeting DSS instead of failing when 'PLUGIN_INTEGRATION_TEST_INSTANCE' is not defined."
+    )
 
 
 def pytest_generate_tests(metafunc):
@@ -28,16 +31,26 @@ def pytest_generate_tests(metafunc):
     Pytest exposed hook allowing to dynamically alterate the pytest representation of a test which is metafunc
     Here we use that hook to dynamically paramertrize the "client" fixture of each tests. 
     Therefore, a new client will be instantiated for each DSS instance.
+    Only the tests requesting the `dss_target` fixture (directly or through `user_dss_clients`) are parametrized,
+    the others (unit tests) never read the run configuration.
+    When `PLUGIN_INTEGRATION_TEST_INSTANCE` is not set, the tests are parametrized with a placeholder target if they
+    are only collected or if `--skip-dss-targets-without-config` is set (they are then skipped at fixture time).
+    Otherwise the missing run configuration makes the collection fail.
 
     Args:
         metafunc: pytest object representing a test function
     """
+    if "dss_target" not in metafunc.fixturenames:
+        return
+
+    if not _has_run_config() and (metafunc.config.getoption("collectonly") or _skip_without_run_config(metafunc.config)):
+        metafunc.parametrize("dss_target", [NO_RUN_CONFIG_TARGET], indirect=["dss_target"])
+        return
+
     curent_run_config = ScenarioConfiguration()
     targets = curent_run_config.targets
-    if metafunc.config.getoption("--exclude-dss-targets"):
-        excluded_targets = metafunc.config.getoption("--exclude-dss-targets")
-        excluded_targets = excluded_targets.split(",")
-
+    excluded_targets = _get_excluded_targets(metafunc.config)
+    if excluded_targets:
         # The excluded targets list is casted as set to use the set arithmetic operators
         excluded_targets = set(excluded_targets)
         targets = set(targets)
@@ -54,6 +67,53 @@ def pytest_generate_tests(metafunc):
     metafunc.parametrize("dss_target", targets, indirect=["dss_target"])
 
 
+def _has_run_config():
+    """
+    Returns:
+        bool: True if the run configuration file is defined through `PLUGIN_INTEGRATION_TEST_INSTANCE`
+    """
+    return bool(os.getenv("PLUGIN_INTEGRATION_TEST_INSTANCE", None))
+
+
+def _skip_without_run_config(config):
+    """
+    Args:
+        config: pytest object holding the session configuration
+
+    Returns:
+        bool: True if the tests targeting DSS should be skipped when there is no run configuration
+    """
+    return config.getoption("--skip-dss-targets-without-config")
+
+
+def _skip_if_no_run_config(config):
+    """
+    Skip the requesting test if there is no run configuration to target the DSS instances and
+    `--skip-dss-targets-without-config` is set.
+
+    Args:
+        config: pytest object holding the session configuration
+    """
+    if not _has_run_config() and _skip_without_run_config(config):
+        pytest.skip("'PLUGIN_INTEGRATION_TEST_INSTANCE' is not defined, no DSS instance to target")
+
+
+def _get_excluded_targets(config):
+    """
+    Parse the `--exclude-dss-targets` command line option.
+
+    Args:
+        config: pytest object holding the session configuration
+
+    Returns:
+        list: The excluded DSS targets, empty if the option is not set
+    """
+    excluded_targets = config.getoption("--exclude-dss-targets")
+    if not excluded_targets:
+        return []
+    return excluded_targets.split(",")
+
+
 @pytest.fixture(scope="function")
 def dss_target(request):
     """
@@ -67,6 +127,8 @@ def dss_target(request):
     Returns:
         The string corresponding to the considered DSS target for the test to be executed
     """
+    if request.param == NO_RUN_CONFIG_TARGET:
+        _skip_if_no_run_config(request.config)
     return request.param
 
 
@@ -98,13 +160,17 @@ def dss_clients(request):
     Returns:
         dssclient: return a instance of a DSS client. It will be the same reference for each test withing the associated context.
     """
+    _skip_if_no_run_config(request.config)
+
+    # Imported here so that loading the pytest plugin does not pay for dataikuapi
+    import dataikuapi
+
+    # Load the logger configuration only once a test actually targets a DSS instance
+    Log()
+
     dss_clients = {}
     current_run_config = ScenarioConfiguration()
-
-    excluded_targets = []
-    if request.config.getoption("--exclude-dss-targets"):
-        excluded_targets = request.config.getoption("--exclude-dss-targets")
-        excluded_targets = excluded_targets.split(",")
+    excluded_targets = _get_excluded_targets(request.config)
 
     logger.info("Instanciating all the DSS clients for each user and DSS instance")
     for host in current_run_config.hosts:
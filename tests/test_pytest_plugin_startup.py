@@ -0,0 +1,130 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PLUGIN_MODULE = "dku_plugin_test_utils.pytest_plugin.plugin"
+
+# Maximum time the plugin may add to a collect-only session, importing dataikuapi alone takes more than that
+PLUGIN_COLLECT_ONLY_OVERHEAD_LIMIT_IN_SEC = 0.1
+TIMED_RUNS = 5
+
+SAMPLE_TEST_MODULE = '''
+import sys
+
+print("DATAIKUAPI_LOADED={}".format("dataikuapi" in sys.modules))
+
+
+def test_unit():
+    assert True
+
+
+def test_integration(user_dss_clients):
+    assert user_dss_clients
+'''
+
+SAMPLE_RUN_CONFIG = {
+    "DSS11": {
+        "url": "http://localhost:11200",
+        "users": {"admin": "api_key", "default": "admin"},
+        "python_interpreter": ["PYTHON36"]
+    }
+}
+
+
+@pytest.fixture
+def sample_test_module(tmp_path):
+    test_module = tmp_path / "test_sample.py"
+    test_module.write_text(SAMPLE_TEST_MODULE)
+    return test_module
+
+
+@pytest.fixture
+def sample_run_config(tmp_path):
+    run_config = tmp_path / "run_config.json"
+    run_config.write_text(json.dumps(SAMPLE_RUN_CONFIG))
+    return run_config
+
+
+def _run_pytest(test_module, *args, run_config=None, load_plugin=True):
+    """
+    Run a pytest session on the given test module.
+    Plugins autoloading is disabled so the plugin is loaded only once, explicitly, even when the package is installed.
+
+    Args:
+        test_module: The test module to run pytest on
+        args: Extra pytest command line arguments
+        run_config: The path to the run configuration file, `PLUGIN_INTEGRATION_TEST_INSTANCE` is unset if None
+        load_plugin (bool): Whether to load the plugin in the pytest session
+
+    Returns:
+        tuple: The completed process and the elapsed time in seconds
+    """
+    env = dict(os.environ)
+    env.pop("PLUGIN_INTEGRATION_TEST_INSTANCE", None)
+    if run_config is not None:
+        env["PLUGIN_INTEGRATION_TEST_INSTANCE"] = str(run_config)
+    env["PYTEST_DISABLE_PLUGIN_AUTOLOAD"] = "1"
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [REPO_ROOT, env.get("PYTHONPATH")]))
+
+    command = [sys.executable, "-m", "pytest", "-s", "-q", "-p", "no:cacheprovider"]
+    if load_plugin:
+        command += ["-p", PLUGIN_MODULE]
+    command += [str(test_module)] + list(args)
+
+    start = time.time()
+    completed_process = subprocess.run(command, cwd=str(test_module.parent), env=env,
+                                       stdout=subprocess.PIPE, stderr=subprocess.STDOUT, universal_newlines=True)
+    return completed_process, time.time() - start
+
+
+def _median_collect_only_time(test_module, load_plugin):
+    elapsed_times = []
+    for _ in range(TIMED_RUNS):
+        completed_process, elapsed_time = _run_pytest(test_module, "--collect-only", load_plugin=load_plugin)
+        assert completed_process.returncode == 0, completed_process.stdout
+        elapsed_times.append(elapsed_time)
+    return statistics.median(elapsed_times)
+
+
+def test_collect_only_does_not_import_dataikuapi(sample_test_module):
+    completed_process, _ = _run_pytest(sample_test_module, "--collect-only")
+
+    assert completed_process.returncode == 0, completed_process.stdout
+    assert "DATAIKUAPI_LOADED=False" in completed_process.stdout
+    assert "test_integration[no-run-config]" in completed_process.stdout
+
+
+def test_collect_only_with_run_config_uses_the_dss_targets(sample_test_module, sample_run_config):
+    completed_process, _ = _run_pytest(sample_test_module, "--collect-only", run_config=sample_run_config)
+
+    assert completed_process.returncode == 0, completed_process.stdout
+    assert "test_integration[DSS11]" in completed_process.stdout
+
+
+def test_collect_only_plugin_overhead(sample_test_module):
+    time_without_plugin = _median_collect_only_time(sample_test_module, load_plugin=False)
+    time_with_plugin = _median_collect_only_time(sample_test_module, load_plugin=True)
+
+    assert time_with_plugin - time_without_plugin < PLUGIN_COLLECT_ONLY_OVERHEAD_LIMIT_IN_SEC
+
+
+def test_run_without_run_config_fails(sample_test_module):
+    completed_process, _ = _run_pytest(sample_test_module)
+
+    assert completed_process.returncode != 0
+    assert "'PLUGIN_INTEGRATION_TEST_INSTANCE' is not defined" in completed_process.stdout
+
+
+def test_run_without_run_config_skips_dss_tests_on_demand(sample_test_module):
+    completed_process, _ = _run_pytest(sample_test_module, "-rs", "--skip-dss-targets-without-config")
+
+    assert completed_process.returncode == 0, completed_process.stdout
+    assert "1 passed, 1 skipped" in completed_process.stdout
+    assert "'PLUGIN_INTEGRATION_TEST_INSTANCE' is not defined" in completed_process.stdout